@@ -12,7 +12,8 @@ from funapis_response import (
     UnknownError,
     ErrorCode,
     ErrorSeverity,
-    UserLevel
+    UserLevel,
+    SEVERITY_HTTP_STATUS
 )
 
 app = Flask(__name__)
@@ -61,14 +62,7 @@ def handle_fun_api_exception(error):
     response_dict = response.to_dict(UserLevel.DEVELOPER)
     
     # 根據錯誤嚴重程度設置 HTTP 狀態碼
-    if error.error_code.severity == ErrorSeverity.WARNING:
-        status_code = 400
-    elif error.error_code.severity == ErrorSeverity.ERROR:
-        status_code = 403
-    elif error.error_code.severity == ErrorSeverity.FATAL:
-        status_code = 500
-    else:
-        status_code = 200
+    status_code = SEVERITY_HTTP_STATUS.get(error.error_code.severity, 200)
     
     return jsonify(response_dict), status_code
 
@@ -94,7 +88,7 @@ def get_users():
     ]
     
     return jsonify(
-        ResponsePayloadBuilder.success(users).build().to_dict()
+        ResponsePayloadBuilder.success_dict(users)
     )
 
 
@@ -106,7 +100,7 @@ def get_user(username):
     
     user = {"id": 1, "username": username}
     return jsonify(
-        ResponsePayloadBuilder.success(user).build().to_dict()
+        ResponsePayloadBuilder.success_dict(user)
     )
 
 
@@ -132,7 +126,7 @@ def create_user():
     }
     
     return jsonify(
-        ResponsePayloadBuilder.success(user).build().to_dict()
+        ResponsePayloadBuilder.success_dict(user)
     ), 201
 
 
@@ -152,7 +146,7 @@ def admin_get_users():
     ]
     
     return jsonify(
-        ResponsePayloadBuilder.success(users).build().to_dict()
+        ResponsePayloadBuilder.success_dict(users)
     )
 
 
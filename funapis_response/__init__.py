@@ -8,6 +8,8 @@ A standardized API response payload library for FUN-prefixed error codes.
 :license: MIT, see LICENSE for more details.
 """
 
+from typing import TYPE_CHECKING
+
 from funapis_response.core.payload import ResponsePayload, PagingPayload, OrderingPayload
 from funapis_response.core.validator import PayloadValidator
 from funapis_response.core.builder import (
@@ -15,16 +17,24 @@ from funapis_response.core.builder import (
     PagingPayloadBuilder,
     OrderingPayloadBuilder,
 )
-from funapis_response.enums.types import ErrorSeverity, SortDirection, UserLevel
-from funapis_response.error_codes import ErrorCode, CommonErrorCodes, ErrorCodeRegistry
-from funapis_response.exceptions import (
-    FunAPIException,
-    ValidationError,
-    APIError,
-    NetworkError,
-    IllegalOperationError,
-    UnknownError
+from funapis_response.enums.types import (
+    ErrorSeverity,
+    SortDirection,
+    UserLevel,
+    SEVERITY_HTTP_STATUS,
 )
+from funapis_response.error_codes import ErrorCode, CommonErrorCodes, ErrorCodeRegistry
+from funapis_response import exceptions as _exceptions
+from funapis_response.exceptions import FunAPIException
+
+if TYPE_CHECKING:
+    from funapis_response.exceptions import (
+        ValidationError,
+        APIError,
+        NetworkError,
+        IllegalOperationError,
+        UnknownError
+    )
 
 __version__ = "0.1.0"
 __all__ = [
@@ -37,6 +47,7 @@ __all__ = [
     "ErrorSeverity",
     "SortDirection",
     "UserLevel",
+    "SEVERITY_HTTP_STATUS",
     "PayloadValidator",
     "ErrorCode",
     "CommonErrorCodes",
@@ -48,3 +59,16 @@ __all__ = [
     "IllegalOperationError",
     "UnknownError",
 ]
+
+
+def __getattr__(name):
+    # The concrete exception classes are loaded lazily by the exceptions package
+    if name in _exceptions._LAZY_EXCEPTIONS:
+        value = getattr(_exceptions, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
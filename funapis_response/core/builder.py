@@ -3,16 +3,22 @@
 from datetime import datetime
 from typing import List, Optional, Any, Dict
 from uuid import UUID, uuid4
-from zoneinfo import ZoneInfo
 
 from funapis_response.core.validator import PayloadValidator
-from funapis_response.core.payload import ResponsePayload, PagingPayload, OrderingPayload
+from funapis_response.core.payload import (
+    ResponsePayload,
+    PagingPayload,
+    OrderingPayload,
+    _TAIPEI_TZ,
+)
 from funapis_response.enums import SortDirection
 
 
 class OrderingPayloadBuilder:
     """Builder for OrderingPayload."""
     
+    __slots__ = ('_property', '_direction')
+    
     def __init__(self) -> None:
         self._property: Optional[str] = None
         self._direction: SortDirection = SortDirection.ASC
@@ -65,6 +71,8 @@ class OrderingPayloadBuilder:
 class PagingPayloadBuilder:
     """Builder for PagingPayload."""
     
+    __slots__ = ('_page', '_page_size', '_total_elements', '_total_pages', '_orders')
+    
     def __init__(self) -> None:
         self._page: Optional[int] = None
         self._page_size: Optional[int] = None
@@ -180,18 +188,13 @@ class PagingPayloadBuilder:
         Returns:
             PagingPayload instance
         """
-        if any(x is None for x in [self._page, self._page_size, self._total_elements, self._total_pages]):
+        if (self._page is None or self._page_size is None
+                or self._total_elements is None or self._total_pages is None):
             raise ValueError("All paging fields must be set")
 
-        # Validate paging parameters
-        paging_params = {
-            'page': self._page,
-            'pageSize': self._page_size,
-            'totalElements': self._total_elements,
-            'totalPages': self._total_pages
-        }
-        
-        if not PayloadValidator.validate_paging_params(paging_params):
+        # Field ranges are enforced by the with_* setters; only the
+        # cross-field check remains
+        if self._total_pages > 0 and self._page >= self._total_pages:
             raise ValueError(
                 f"Invalid paging parameters: page={self._page}, "
                 f"pageSize={self._page_size}, "
@@ -204,16 +207,28 @@ class PagingPayloadBuilder:
             page_size=self._page_size,
             total_elements=self._total_elements,
             total_pages=self._total_pages,
-            orders=self._orders
+            # Copy so later add_order() calls do not alter the built payload
+            orders=list(self._orders)
         )
 
 
 class ResponsePayloadBuilder:
     """Builder for ResponsePayload with simplified security."""
     
+    __slots__ = (
+        '_message_id',
+        '_message_datetime',
+        '_error_code',
+        '_error_desc',
+        '_data',
+        '_paging',
+        '_stack_trace',
+    )
+    
     def __init__(self) -> None:
-        self._message_id: UUID = uuid4()
-        self._message_datetime: datetime = datetime.now(ZoneInfo("Asia/Taipei"))
+        # Resolved in build() unless set explicitly
+        self._message_id: Optional[UUID] = None
+        self._message_datetime: Optional[datetime] = None
         self._error_code: Optional[str] = None
         self._error_desc: Optional[str] = None
         self._data: Any = None
@@ -351,11 +366,14 @@ class ResponsePayloadBuilder:
         builder.with_error_code(exception.error_code.code)
         builder.with_error_desc(exception.message)
         
-        if exception.data:
-            builder.with_data(exception.data)
+        # 以 None 判斷是否提供，保留 0、[]、"" 等空值資料
+        data = exception.data
+        if data is not None:
+            builder.with_data(data)
         
-        if exception.stack_trace:
-            builder.with_stack_trace(exception.stack_trace)
+        stack_trace = exception.stack_trace
+        if stack_trace is not None:
+            builder.with_stack_trace(stack_trace)
         
         return builder
     
@@ -376,11 +394,48 @@ class ResponsePayloadBuilder:
         builder = cls()
         builder.with_error(CommonErrorCodes.SUCCESS)
         
-        if data:
+        if data is not None:
             builder.with_data(data)
         
         return builder
     
+    @classmethod
+    def success_dict(
+        cls,
+        data: Optional[Any] = None,
+        paging: Optional[PagingPayload] = None
+    ) -> Dict[str, Any]:
+        """
+        直接創建成功響應的字典表示，不經過構建器與 ResponsePayload
+        
+        輸出格式與 build().to_dict() 相同，適用於立即交給 jsonify 等序列化函式的情境。
+        
+        Args:
+            data: 響應數據
+            paging: 分頁資訊
+            
+        Returns:
+            成功響應的字典表示
+        """
+        # Import here to avoid circular imports
+        from funapis_response.error_codes.common import CommonErrorCodes
+        
+        success = CommonErrorCodes.SUCCESS
+        result = {
+            "messageId": str(uuid4()),
+            "messageDatetime": datetime.now(_TAIPEI_TZ).isoformat(),
+            "errorCode": success.code,
+            "errorDesc": success.get_message()
+        }
+        
+        if data is not None:
+            result["data"] = data
+        
+        if paging is not None:
+            result["paging"] = paging.to_dict()
+        
+        return result
+    
     def build(self) -> ResponsePayload:
         """
         Build the ResponsePayload instance.
@@ -394,9 +449,17 @@ class ResponsePayloadBuilder:
         if not self._error_code or not self._error_desc:
             raise ValueError("Error code and description are required")
 
+        message_id = self._message_id
+        if message_id is None:
+            message_id = uuid4()
+
+        message_datetime = self._message_datetime
+        if message_datetime is None:
+            message_datetime = datetime.now(_TAIPEI_TZ)
+
         return ResponsePayload(
-            message_id=self._message_id,
-            message_datetime=self._message_datetime,
+            message_id=message_id,
+            message_datetime=message_datetime,
             error_code=self._error_code,
             error_desc=self._error_desc,
             data=self._data,
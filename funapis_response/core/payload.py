@@ -1,50 +1,129 @@
 """Core payload classes for the response library."""
 
-from dataclasses import dataclass, field
+from dataclasses import FrozenInstanceError
 from datetime import datetime
 import json
-from typing import Any, List, Optional, Dict
-from uuid import UUID
+from operator import attrgetter
+from typing import Any, List, Optional, Dict, Tuple
+from uuid import UUID, uuid4
+from zoneinfo import ZoneInfo
 
+from funapis_response.core.validator import PayloadValidator
 from funapis_response.enums import SortDirection, UserLevel
 
+# Default timezone for message timestamps
+_TAIPEI_TZ = ZoneInfo("Asia/Taipei")
 
-@dataclass(frozen=True)
-class OrderingPayload:
+# Bypasses the frozen __setattr__ while initializing slots
+_set = object.__setattr__
+
+# Reads an OrderingPayload's cached dict without a Python-level call
+_ORDER_DICT = attrgetter("_cached_dict")
+
+
+class _FrozenPayload:
+    """
+    Base for immutable, slotted payload classes.
+    
+    Subclasses list their constructor fields in ``_fields`` (in signature
+    order) and assign them with ``object.__setattr__`` in ``__init__``.
+    Equality, hashing, repr and pickling are derived from those fields.
+    """
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def _astuple(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is self.__class__:
+            return self._astuple() == other._astuple()
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._astuple())
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{self.__class__.__qualname__}({fields})"
+
+    def __reduce__(self):
+        return self.__class__, self._astuple()
+
+
+class OrderingPayload(_FrozenPayload):
     """Immutable class for sorting information."""
-    property: str
-    direction: SortDirection = SortDirection.ASC
+    __slots__ = ("property", "direction", "_cached_dict")
+    _fields = ("property", "direction")
+
+    def __init__(self, property: str, direction: SortDirection = SortDirection.ASC) -> None:
+        _set(self, "property", property)
+        _set(self, "direction", direction)
+        # Cache the dictionary representation; to_dict returns copies of it
+        _set(self, "_cached_dict", {
+            "property": property,
+            "direction": direction.value
+        })
 
     def to_dict(self) -> Dict[str, str]:
-        """Convert to dictionary representation."""
-        return {
-            "property": self.property,
-            "direction": self.direction.value
-        }
+        """
+        Convert to dictionary representation.
+        
+        Returns:
+            New dict built from the cached representation
+        """
+        return dict(self._cached_dict)
 
 
-@dataclass(frozen=True)
-class PagingPayload:
+class PagingPayload(_FrozenPayload):
     """Immutable class for pagination information."""
-    page: int
-    page_size: int
-    total_elements: int
-    total_pages: int
-    orders: List[OrderingPayload] = field(default_factory=list)
+    __slots__ = ("page", "page_size", "total_elements", "total_pages", "orders", "_cached_dict")
+    _fields = ("page", "page_size", "total_elements", "total_pages", "orders")
+
+    def __init__(
+        self,
+        page: int,
+        page_size: int,
+        total_elements: int,
+        total_pages: int,
+        orders: Optional[List[OrderingPayload]] = None
+    ) -> None:
+        if orders is None:
+            orders = []
+        _set(self, "page", page)
+        _set(self, "page_size", page_size)
+        _set(self, "total_elements", total_elements)
+        _set(self, "total_pages", total_pages)
+        _set(self, "orders", orders)
+        # Cache the scalar part of the dictionary representation; orders are
+        # read from self.orders on each call so they always match it
+        _set(self, "_cached_dict", {
+            "page": page,
+            "pageSize": page_size,
+            "totalElements": total_elements,
+            "totalPages": total_pages
+        })
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary representation."""
-        return {
-            "page": self.page,
-            "pageSize": self.page_size,
-            "totalElements": self.total_elements,
-            "totalPages": self.total_pages,
-            "orders": [order.to_dict() for order in self.orders]
-        }
+        """
+        Convert to dictionary representation.
+        
+        Returns:
+            New dict built from the cached representation
+        """
+        result = dict(self._cached_dict)
+        # Fresh copies of each order's cached dict so callers cannot mutate it
+        result["orders"] = [dict(order) for order in map(_ORDER_DICT, self.orders)]
+        return result
 
 
-@dataclass(frozen=True)
-class ResponsePayload:
+class ResponsePayload(_FrozenPayload):
     """
     Immutable class for HTTP API response payload.
     
@@ -57,13 +136,91 @@ class ResponsePayload:
         paging: Pagination information
         _stack_trace: Stack trace for debugging (private)
     """
-    message_id: UUID
-    message_datetime: datetime
-    error_code: str
-    error_desc: str
-    data: Optional[Any] = None
-    paging: Optional[PagingPayload] = None
-    _stack_trace: Optional[str] = None
+    __slots__ = (
+        "message_id",
+        "message_datetime",
+        "error_code",
+        "error_desc",
+        "data",
+        "paging",
+        "_stack_trace",
+        "_message_id_str",
+        "_message_datetime_iso",
+    )
+    _fields = (
+        "message_id",
+        "message_datetime",
+        "error_code",
+        "error_desc",
+        "data",
+        "paging",
+        "_stack_trace",
+    )
+
+    def __init__(
+        self,
+        message_id: UUID,
+        message_datetime: datetime,
+        error_code: str,
+        error_desc: str,
+        data: Optional[Any] = None,
+        paging: Optional[PagingPayload] = None,
+        _stack_trace: Optional[str] = None
+    ) -> None:
+        _set(self, "message_id", message_id)
+        _set(self, "message_datetime", message_datetime)
+        _set(self, "error_code", error_code)
+        _set(self, "error_desc", error_desc)
+        _set(self, "data", data)
+        _set(self, "paging", paging)
+        _set(self, "_stack_trace", _stack_trace)
+        # Cache the serialized forms of the immutable id and timestamp
+        _set(self, "_message_id_str", str(message_id))
+        _set(self, "_message_datetime_iso", message_datetime.isoformat())
+
+    @classmethod
+    def from_error(
+        cls,
+        error_code: str,
+        error_desc: str,
+        data: Optional[Any] = None,
+        stack_trace: Optional[str] = None
+    ) -> 'ResponsePayload':
+        """
+        Create an error response directly, without going through a builder.
+        
+        Args:
+            error_code: Error code in FUNxxyyzzz format
+            error_desc: Human-readable error description
+            data: Optional response data
+            stack_trace: Optional debug stack trace (only visible to developers)
+            
+        Raises:
+            ValueError: If error code format is invalid
+            
+        Returns:
+            ResponsePayload with a new message ID and the current Taiwan time
+        """
+        if not PayloadValidator.validate_error_code(error_code):
+            raise ValueError(f"Invalid error code format: {error_code}. Must be in FUNxxyyzzz format.")
+
+        return cls._internal_create(error_code, error_desc, data, stack_trace)
+
+    @classmethod
+    def _internal_create(
+        cls,
+        error_code: str,
+        error_desc: str,
+        data: Optional[Any] = None,
+        stack_trace: Optional[str] = None
+    ) -> 'ResponsePayload':
+        """
+        Create a response for an error code that is already known to be valid.
+        
+        Skips error code validation; library code uses it for codes taken
+        from ErrorCode instances.
+        """
+        return cls(uuid4(), datetime.now(_TAIPEI_TZ), error_code, error_desc, data, None, stack_trace)
 
     def to_dict(self, user_level: UserLevel = UserLevel.GENERAL_USER) -> Dict[str, Any]:
         """
@@ -76,20 +233,22 @@ class ResponsePayload:
             Dict containing the response payload
         """
         result = {
-            "messageId": str(self.message_id),
-            "messageDatetime": self.message_datetime.isoformat(),
+            "messageId": self._message_id_str,
+            "messageDatetime": self._message_datetime_iso,
             "errorCode": self.error_code,
             "errorDesc": self.error_desc
         }
 
-        if self.data is not None:
-            result["data"] = self.data
+        data = self.data
+        if data is not None:
+            result["data"] = data
 
-        if self.paging is not None:
-            result["paging"] = self.paging.to_dict()
+        paging = self.paging
+        if paging is not None:
+            result["paging"] = paging.to_dict()
 
         # Simplified security: only show stack trace to developers
-        if self._stack_trace and user_level == UserLevel.DEVELOPER:
+        if self._stack_trace and user_level is UserLevel.DEVELOPER:
             result["stackTrace"] = self._stack_trace
 
         return result
@@ -5,6 +5,11 @@ from datetime import datetime
 from typing import Dict
 
 
+# Error code format: FUN followed by 9 ASCII digits (compiled once at import,
+# with fullmatch bound to skip the attribute lookup per call)
+_match_error_code = re.compile(r'FUN\d{9}', re.ASCII).fullmatch
+
+
 class PayloadValidator:
     """Validator for response payload components."""
 
@@ -19,8 +24,7 @@ class PayloadValidator:
         Returns:
             bool: True if valid, False otherwise
         """
-        pattern = r'^FUN\d{9}$'
-        return bool(re.match(pattern, error_code))
+        return _match_error_code(error_code) is not None
 
     @staticmethod
     def validate_datetime_format(dt: datetime) -> bool:
@@ -33,7 +37,10 @@ class PayloadValidator:
         Returns:
             bool: True if valid, False otherwise
         """
-        return dt.tzinfo is not None
+        # tzinfo check short-circuits the common aware case; a tzinfo whose
+        # utcoffset() returns None still leaves the datetime naive
+        tzinfo = dt.tzinfo
+        return tzinfo is not None and tzinfo.utcoffset(dt) is not None
 
     @staticmethod
     def validate_paging_params(params: Dict) -> bool:
@@ -52,19 +59,44 @@ class PayloadValidator:
         if not all(key in params for key in required_keys):
             return False
             
-        # Validate values
+        return PayloadValidator._validate_paging_values(
+            params['page'],
+            params['pageSize'],
+            params['totalElements'],
+            params['totalPages']
+        )
+
+    @staticmethod
+    def _validate_paging_values(
+        page: int,
+        page_size: int,
+        total_elements: int,
+        total_pages: int
+    ) -> bool:
+        """
+        Validate paging values for validate_paging_params.
+        
+        Args:
+            page: Zero-based page number
+            page_size: Number of items per page
+            total_elements: Total number of items
+            total_pages: Total number of pages
+            
+        Returns:
+            bool: True if valid, False otherwise
+        """
         try:
-            if params['page'] < 0:
+            if page < 0:
                 return False
-            if params['pageSize'] <= 0:
+            if page_size <= 0:
                 return False
-            if params['totalElements'] < 0:
+            if total_elements < 0:
                 return False
-            if params['totalPages'] < 0:
+            if total_pages < 0:
                 return False
                 
             # Logical validation
-            if params['totalPages'] > 0 and params['page'] >= params['totalPages']:
+            if total_pages > 0 and page >= total_pages:
                 return False
                 
             return True
@@ -1,5 +1,10 @@
 """Enumeration module for funapis-response."""
 
-from funapis_response.enums.types import ErrorSeverity, SortDirection, UserLevel
+from funapis_response.enums.types import (
+    ErrorSeverity,
+    SortDirection,
+    UserLevel,
+    SEVERITY_HTTP_STATUS,
+)
 
-__all__ = ["ErrorSeverity", "SortDirection", "UserLevel"]
\ No newline at end of file
+__all__ = ["ErrorSeverity", "SortDirection", "UserLevel", "SEVERITY_HTTP_STATUS"]
\ No newline at end of file
@@ -11,6 +11,15 @@ class ErrorSeverity(Enum):
     FATAL = "FATAL"
 
 
+# Default HTTP status code for each error severity
+SEVERITY_HTTP_STATUS = {
+    ErrorSeverity.INFO: 200,
+    ErrorSeverity.WARNING: 400,
+    ErrorSeverity.ERROR: 403,
+    ErrorSeverity.FATAL: 500,
+}
+
+
 class SortDirection(Enum):
     """Sort direction for ordering."""
     ASC = "ASC"
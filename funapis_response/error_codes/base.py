@@ -1,36 +1,174 @@
 """Error code base implementation."""
 
 import re
-from dataclasses import dataclass
-from enum import Enum
-from typing import Optional, ClassVar, Dict
+import string
+import sys
+from dataclasses import FrozenInstanceError
+from typing import List, Optional, Sequence, Tuple
 
 from funapis_response.enums import ErrorSeverity
 
 
-@dataclass(frozen=True)
+# 錯誤碼格式 FUN + 9 位 ASCII 數字，直接綁定 fullmatch 以省去每次的屬性查找
+_match_error_code = re.compile(r'FUN\d{9}', re.ASCII).fullmatch
+
+_FORMATTER = string.Formatter()
+
+# 批次驗證達此數量時改用 NumPy 向量化檢查（量測的交叉點約在 100~200 筆）
+_VECTORIZE_THRESHOLD = 128
+
+# NumPy 為選用依賴，首次需要時才載入；False 表示尚未嘗試載入
+_numpy = False
+
+
+def _load_numpy():
+    """載入 NumPy，未安裝時返回 None"""
+    global _numpy
+    if _numpy is False:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
+
+def _parse_template(template: str) -> Optional[Tuple[Tuple[str, Optional[str], Optional[int]], ...]]:
+    """
+    將訊息模板預先拆解為 (文字, 欄位名稱, 位置索引) 片段
+    
+    位置索引依欄位名稱首次出現的順序編號，重複出現的欄位共用同一索引。
+    僅處理 {name} 形式的欄位；含格式規格、轉換或索引等欄位的模板返回 None，
+    由 str.format 處理。
+    """
+    segments = []
+    indexes = {}
+    try:
+        for literal, field_name, format_spec, conversion in _FORMATTER.parse(template):
+            if field_name is None:
+                segments.append((literal, None, None))
+                continue
+            if format_spec or conversion or not field_name.isidentifier():
+                return None
+            segments.append((literal, field_name, indexes.setdefault(field_name, len(indexes))))
+    except ValueError:
+        return None
+    return tuple(segments)
+
+
+def _root_field_name(field_name: str) -> str:
+    """取得欄位運算式的參數名稱，例如 a.real 與 a[0] 皆為 a"""
+    return field_name.partition('.')[0].partition('[')[0]
+
+
+# 略過凍結的 __setattr__ 以初始化 slots
+_set = object.__setattr__
+
+
 class ErrorCode:
-    """錯誤碼基礎類"""
-    code: str
-    severity: ErrorSeverity
-    message_template: str
+    """錯誤碼基礎類（不可變，以錯誤碼字符串判斷相等）"""
     
-    # 類變量，用於保存所有錯誤碼實例的映射
-    _registry: ClassVar[Dict[str, 'ErrorCode']] = {}
+    __slots__ = ('code', 'severity', 'message_template', '_segments')
     
-    def __post_init__(self):
-        """驗證錯誤碼格式並註冊實例"""
-        if not self._validate_code_format(self.code):
-            raise ValueError(f"Invalid error code format: {self.code}. Must be in FUNxxyyzzz format.")
+    def __init__(self, code: str, severity: ErrorSeverity, message_template: str):
+        """驗證錯誤碼格式並初始化"""
+        if not self._validate_code_format(code):
+            raise ValueError(f"Invalid error code format: {code}. Must be in FUNxxyyzzz format.")
         
-        # 註冊錯誤碼
-        ErrorCode._registry[self.code] = self
+        self._init_fields(code, severity, message_template)
+    
+    def _init_fields(self, code: str, severity: ErrorSeverity, message_template: str) -> None:
+        """設定欄位並預先拆解訊息模板"""
+        # 駐留錯誤碼字符串，使註冊表鍵值與各處引用共用同一物件
+        if type(code) is str:
+            code = sys.intern(code)
+        _set(self, 'code', code)
+        _set(self, 'severity', severity)
+        _set(self, 'message_template', message_template)
+        _set(self, '_segments', _parse_template(message_template))
+    
+    @classmethod
+    def _trusted(cls, code: str, severity: ErrorSeverity, message_template: str) -> 'ErrorCode':
+        """
+        建立函式庫內建的錯誤碼，略過格式驗證
+        
+        僅供已知格式正確的內部錯誤碼使用，使用者定義的錯誤碼應直接呼叫建構子。
+        
+        Args:
+            code: 錯誤碼字符串
+            severity: 錯誤嚴重程度
+            message_template: 錯誤訊息模板
+            
+        Returns:
+            ErrorCode 實例
+        """
+        error_code = object.__new__(cls)
+        error_code._init_fields(code, severity, message_template)
+        return error_code
+    
+    def __setattr__(self, name: str, value) -> None:
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+    
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ErrorCode):
+            return self.code == other.code
+        return NotImplemented
+    
+    def __hash__(self) -> int:
+        return hash(self.code)
+    
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(code={self.code!r}, "
+            f"severity={self.severity!r}, message_template={self.message_template!r})"
+        )
+    
+    def __reduce__(self):
+        return self.__class__, (self.code, self.severity, self.message_template)
     
     @staticmethod
     def _validate_code_format(code: str) -> bool:
         """驗證錯誤碼格式 (FUNxxyyzzz)"""
-        pattern = r'^FUN\d{9}$'
-        return bool(re.match(pattern, code))
+        return _match_error_code(code) is not None
+    
+    @staticmethod
+    def validate_many(codes: Sequence[str]) -> List[bool]:
+        """
+        批次驗證錯誤碼格式
+        
+        數量達門檻且已安裝 NumPy 時，以單次向量化運算檢查所有錯誤碼；
+        否則逐一驗證。非字串項目視為格式錯誤。
+        
+        Args:
+            codes: 錯誤碼字符串序列
+            
+        Returns:
+            與輸入順序對應的驗證結果列表
+        """
+        np = None
+        # 僅在全部為 str 時向量化，np.array 會將其他型別轉為字串
+        if len(codes) >= _VECTORIZE_THRESHOLD and set(map(type, codes)) == {str}:
+            np = _load_numpy()
+        if np is None:
+            return [isinstance(code, str) and _match_error_code(code) is not None for code in codes]
+        
+        # 長度需另行檢查：NumPy 的 U 型別會去除結尾的 NUL 字元並截斷過長字串
+        count = len(codes)
+        lengths = np.fromiter(map(len, codes), dtype=np.intp, count=count)
+        # 以 UCS-4 儲存，每筆 12 個碼位
+        chars = np.array(codes, dtype='U12').view(np.uint32).reshape(count, 12)
+        digits = chars[:, 3:]
+        mask = (
+            (lengths == 12)
+            & (chars[:, 0] == ord('F'))
+            & (chars[:, 1] == ord('U'))
+            & (chars[:, 2] == ord('N'))
+            & ((digits >= ord('0')) & (digits <= ord('9'))).all(axis=1)
+        )
+        return mask.tolist()
     
     def get_message(self, **kwargs) -> str:
         """
@@ -42,17 +180,65 @@ class ErrorCode:
         Returns:
             格式化後的錯誤訊息
         """
+        segments = self._segments
         try:
-            return self.message_template.format(**kwargs)
+            if segments is None:
+                return self.message_template.format(**kwargs)
+            
+            parts = []
+            for literal, field_name, _ in segments:
+                parts.append(literal)
+                if field_name is not None:
+                    parts.append(format(kwargs[field_name]))
+            return "".join(parts)
         except KeyError as e:
             return f"{self.message_template} (缺少格式化參數: {e})"
         except Exception:
             return self.message_template
     
+    def format_positional(self, *values) -> str:
+        """
+        以位置參數格式化錯誤訊息
+        
+        參數依模板中欄位名稱首次出現的順序對應，例如模板
+        "參數驗證錯誤: {reason}" 可直接以 format_positional(reason) 格式化，
+        不需建立關鍵字參數字典。
+        
+        Args:
+            *values: 依欄位順序排列的格式化參數
+            
+        Returns:
+            格式化後的錯誤訊息
+        """
+        segments = self._segments
+        if segments is None:
+            # 無法預先拆解的模板，依參數名稱轉為關鍵字參數交由 get_message 處理
+            try:
+                names = dict.fromkeys(
+                    _root_field_name(field_name)
+                    for _, field_name, _, _ in _FORMATTER.parse(self.message_template)
+                    if field_name
+                )
+            except ValueError:
+                return self.message_template
+            return self.get_message(**dict(zip(names, values)))
+        
+        parts = []
+        try:
+            for literal, field_name, index in segments:
+                parts.append(literal)
+                if index is not None:
+                    parts.append(format(values[index]))
+        except IndexError:
+            return f"{self.message_template} (缺少格式化參數: {field_name!r})"
+        except Exception:
+            return self.message_template
+        return "".join(parts)
+    
     @classmethod
     def get_by_code(cls, code: str) -> Optional['ErrorCode']:
         """
-        根據錯誤碼獲取錯誤碼實例
+        根據錯誤碼獲取已註冊的錯誤碼實例
         
         Args:
             code: 錯誤碼字符串
@@ -60,4 +246,7 @@ class ErrorCode:
         Returns:
             ErrorCode 實例，如果不存在則返回 None
         """
-        return cls._registry.get(code)
+        # Import here to avoid circular imports
+        from funapis_response.error_codes.registry import ErrorCodeRegistry
+        
+        return ErrorCodeRegistry.get_by_code(code)
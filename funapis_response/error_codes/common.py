@@ -1,50 +1,86 @@
 """Common error codes implementation."""
 
 from funapis_response.error_codes.base import ErrorCode
+from funapis_response.error_codes.registry import _register_default
 from funapis_response.enums import ErrorSeverity
 
 
+class _LazyErrorCode:
+    """延遲建立錯誤碼的類屬性描述器，首次存取時才建立並註冊 ErrorCode"""
+    
+    def __init__(self, code: str, severity: ErrorSeverity, message_template: str):
+        self.code = code
+        self.severity = severity
+        self.message_template = message_template
+        self.name = None
+    
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+    
+    def __get__(self, instance, owner) -> ErrorCode:
+        # 內建錯誤碼格式已知正確，略過驗證
+        error_code = ErrorCode._trusted(self.code, self.severity, self.message_template)
+        # 不覆蓋使用者已註冊的同代碼錯誤碼
+        _register_default(error_code)
+        # 以實例取代描述器，之後的存取即為一般類屬性查找
+        setattr(owner, self.name, error_code)
+        return error_code
+
+
 class CommonErrorCodes:
     """通用錯誤碼定義"""
     
+    # 是否已建立所有通用錯誤碼
+    _all_loaded = False
+    
     # 成功
-    SUCCESS = ErrorCode(
+    SUCCESS = _LazyErrorCode(
         code="FUN006600001",
         severity=ErrorSeverity.INFO,
         message_template="操作成功"
     )
     
     # 參數驗證錯誤
-    VALIDATION_ERROR = ErrorCode(
+    VALIDATION_ERROR = _LazyErrorCode(
         code="FUN999999993",
         severity=ErrorSeverity.WARNING,
         message_template="參數驗證失敗: {reason}"
     )
     
     # API 錯誤
-    API_ERROR = ErrorCode(
+    API_ERROR = _LazyErrorCode(
         code="FUN999999994",
         severity=ErrorSeverity.ERROR,
         message_template="API 調用錯誤: {message}"
     )
     
     # 網路錯誤
-    NETWORK_ERROR = ErrorCode(
+    NETWORK_ERROR = _LazyErrorCode(
         code="FUN999999995",
         severity=ErrorSeverity.ERROR,
         message_template="網路連接錯誤: {message}"
     )
     
     # 非法操作
-    ILLEGAL_OPERATION = ErrorCode(
+    ILLEGAL_OPERATION = _LazyErrorCode(
         code="FUN999900001",
         severity=ErrorSeverity.ERROR,
         message_template="非法操作: {reason}"
     )
     
     # 未知錯誤
-    UNKNOWN_ERROR = ErrorCode(
+    UNKNOWN_ERROR = _LazyErrorCode(
         code="FUN999999999",
         severity=ErrorSeverity.FATAL,
         message_template="未知錯誤: {message}"
     )
+    
+    @classmethod
+    def load_all(cls) -> None:
+        """建立並註冊所有尚未存取過的通用錯誤碼"""
+        if cls._all_loaded:
+            return
+        for name, value in list(vars(cls).items()):
+            if isinstance(value, _LazyErrorCode):
+                getattr(cls, name)
+        cls._all_loaded = True
@@ -1,20 +1,79 @@
 """Error code registry implementation."""
 
-from typing import Dict, Optional, List
+from __future__ import annotations
+
+import threading
+from collections.abc import Mapping
+from types import MappingProxyType
 
 from funapis_response.error_codes.base import ErrorCode
 
 
+# 錯誤碼註冊表：讀取為單次 dict 操作，僅寫入時加鎖
+_REGISTRY: dict[str, ErrorCode] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+# get_all_codes() 的快取，註冊新錯誤碼時失效
+_all_codes_cache: tuple[ErrorCode, ...] | None = None
+
+
+def _load_common_codes() -> bool:
+    """確保延遲建立的通用錯誤碼皆已註冊，本次有新建立時返回 True"""
+    # Import here to avoid circular imports
+    from funapis_response.error_codes.common import CommonErrorCodes
+    
+    if CommonErrorCodes._all_loaded:
+        return False
+    CommonErrorCodes.load_all()
+    return True
+
+
+def _register_default(error_code: ErrorCode) -> ErrorCode:
+    """
+    註冊內建錯誤碼，僅在該代碼尚未註冊時加入
+    
+    通用錯誤碼於首次存取時才註冊，不可覆蓋使用者先前以 register() 註冊的同代碼錯誤碼。
+    
+    Returns:
+        註冊表中該代碼的錯誤碼
+    """
+    global _all_codes_cache
+    
+    with _REGISTRY_LOCK:
+        registered = _REGISTRY.setdefault(error_code.code, error_code)
+        if registered is error_code:
+            _all_codes_cache = None
+    return registered
+
+
 class ErrorCodeRegistry:
     """
-    錯誤碼註冊表，提供更高級的查詢功能
+    錯誤碼註冊表，提供錯誤碼的註冊與查詢功能
     
-    這個類提供對由 ErrorCode._registry 支援的錯誤碼註冊表的高級查詢，
-    如果將來需要擴展錯誤碼註冊表的功能，可以在此處實現。
+    建立 ErrorCode 不會自動註冊，需要以代碼查詢的錯誤碼應透過 register() 註冊；
+    CommonErrorCodes 中的通用錯誤碼會自動註冊。
     """
     
     @staticmethod
-    def get_by_code(code: str) -> Optional[ErrorCode]:
+    def register(error_code: ErrorCode) -> ErrorCode:
+        """
+        註冊錯誤碼，相同代碼的既有錯誤碼會被取代
+        
+        Args:
+            error_code: ErrorCode 實例
+            
+        Returns:
+            傳入的 ErrorCode 實例，方便於定義時直接註冊
+        """
+        global _all_codes_cache
+        
+        with _REGISTRY_LOCK:
+            _REGISTRY[error_code.code] = error_code
+            _all_codes_cache = None
+        return error_code
+    
+    @staticmethod
+    def get_by_code(code: str) -> ErrorCode | None:
         """
         根據錯誤碼獲取錯誤碼實例
         
@@ -24,24 +83,36 @@ class ErrorCodeRegistry:
         Returns:
             ErrorCode 實例，如果不存在則返回 None
         """
-        return ErrorCode.get_by_code(code)
+        error_code = _REGISTRY.get(code)
+        # 通用錯誤碼採延遲建立，查無結果時確保其已註冊後再查一次
+        if error_code is None and _load_common_codes():
+            error_code = _REGISTRY.get(code)
+        return error_code
     
     @staticmethod
-    def get_all_codes() -> List[ErrorCode]:
+    def get_all_codes() -> tuple[ErrorCode, ...]:
         """
         獲取所有註冊的錯誤碼
         
         Returns:
-            ErrorCode 實例列表
+            ErrorCode 實例組成的 tuple，於註冊表變更前重複使用
         """
-        return list(ErrorCode._registry.values())
+        global _all_codes_cache
+        
+        _load_common_codes()
+        codes = _all_codes_cache
+        if codes is None:
+            with _REGISTRY_LOCK:
+                codes = _all_codes_cache = tuple(_REGISTRY.values())
+        return codes
     
     @staticmethod
-    def get_registry() -> Dict[str, ErrorCode]:
+    def get_registry() -> Mapping[str, ErrorCode]:
         """
         獲取整個錯誤碼註冊表
         
         Returns:
-            錯誤碼註冊表的副本
+            錯誤碼註冊表的唯讀檢視，會反映之後的註冊
         """
-        return ErrorCode._registry.copy()
+        _load_common_codes()
+        return MappingProxyType(_REGISTRY)
@@ -1,13 +1,27 @@
 """Exceptions package."""
 
+import importlib
+from typing import TYPE_CHECKING
+
 from funapis_response.exceptions.base import FunAPIException
-from funapis_response.exceptions.api_exceptions import (
-    ValidationError,
-    APIError,
-    NetworkError,
-    IllegalOperationError,
-    UnknownError
-)
+
+if TYPE_CHECKING:
+    from funapis_response.exceptions.api_exceptions import (
+        ValidationError,
+        APIError,
+        NetworkError,
+        IllegalOperationError,
+        UnknownError
+    )
+
+# Exception classes loaded on first access (PEP 562), mapped to their submodule
+_LAZY_EXCEPTIONS = {
+    "ValidationError": "api_exceptions",
+    "APIError": "api_exceptions",
+    "NetworkError": "api_exceptions",
+    "IllegalOperationError": "api_exceptions",
+    "UnknownError": "api_exceptions",
+}
 
 __all__ = [
     "FunAPIException",
@@ -17,3 +31,17 @@ __all__ = [
     "IllegalOperationError",
     "UnknownError"
 ]
+
+
+def __getattr__(name):
+    submodule = _LAZY_EXCEPTIONS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{submodule}"), name)
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
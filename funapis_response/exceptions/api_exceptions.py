@@ -1,27 +1,37 @@
 """API-related exceptions implementation."""
 
-import traceback
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+from typing import Any
 
 from funapis_response.error_codes.common import CommonErrorCodes
 from funapis_response.exceptions.base import FunAPIException
 
 
+# 綁定各例外使用的錯誤碼，建構時以單次全域查找取得
+_VALIDATION = CommonErrorCodes.VALIDATION_ERROR
+_API = CommonErrorCodes.API_ERROR
+_NETWORK = CommonErrorCodes.NETWORK_ERROR
+_ILLEGAL = CommonErrorCodes.ILLEGAL_OPERATION
+_UNKNOWN = CommonErrorCodes.UNKNOWN_ERROR
+
+
 class ValidationError(FunAPIException):
     """參數驗證錯誤"""
     
     def __init__(
         self,
         reason: str,
-        data: Optional[Any] = None,
+        data: Any | None = None,
         include_trace: bool = False
     ):
-        stack_trace = traceback.format_exc() if include_trace else None
+        error_code = _VALIDATION
         super().__init__(
-            error_code=CommonErrorCodes.VALIDATION_ERROR,
+            error_code=error_code,
             message_params={"reason": reason},
             data=data,
-            stack_trace=stack_trace
+            include_trace=include_trace,
+            message=error_code.format_positional(reason)
         )
 
 
@@ -31,15 +41,16 @@ class APIError(FunAPIException):
     def __init__(
         self,
         message: str,
-        data: Optional[Any] = None,
+        data: Any | None = None,
         include_trace: bool = True
     ):
-        stack_trace = traceback.format_exc() if include_trace else None
+        error_code = _API
         super().__init__(
-            error_code=CommonErrorCodes.API_ERROR,
+            error_code=error_code,
             message_params={"message": message},
             data=data,
-            stack_trace=stack_trace
+            include_trace=include_trace,
+            message=error_code.format_positional(message)
         )
 
 
@@ -49,15 +60,16 @@ class NetworkError(FunAPIException):
     def __init__(
         self,
         message: str,
-        data: Optional[Any] = None,
+        data: Any | None = None,
         include_trace: bool = True
     ):
-        stack_trace = traceback.format_exc() if include_trace else None
+        error_code = _NETWORK
         super().__init__(
-            error_code=CommonErrorCodes.NETWORK_ERROR,
+            error_code=error_code,
             message_params={"message": message},
             data=data,
-            stack_trace=stack_trace
+            include_trace=include_trace,
+            message=error_code.format_positional(message)
         )
 
 
@@ -67,32 +79,42 @@ class IllegalOperationError(FunAPIException):
     def __init__(
         self,
         reason: str,
-        data: Optional[Any] = None,
+        data: Any | None = None,
         include_trace: bool = False
     ):
-        stack_trace = traceback.format_exc() if include_trace else None
+        error_code = _ILLEGAL
         super().__init__(
-            error_code=CommonErrorCodes.ILLEGAL_OPERATION,
+            error_code=error_code,
             message_params={"reason": reason},
             data=data,
-            stack_trace=stack_trace
+            include_trace=include_trace,
+            message=error_code.format_positional(reason)
         )
 
 
 class UnknownError(FunAPIException):
     """未知錯誤"""
     
+    # 預設訊息及其格式化結果，於匯入時計算一次
+    DEFAULT_MESSAGE = "發生未預期的錯誤"
+    _DEFAULT_ERROR_MESSAGE = _UNKNOWN.format_positional(DEFAULT_MESSAGE)
+    
     def __init__(
         self,
-        message: Optional[str] = None,
-        data: Optional[Any] = None,
+        message: str | None = None,
+        data: Any | None = None,
         include_trace: bool = True
     ):
-        message = message or "發生未預期的錯誤"
-        stack_trace = traceback.format_exc() if include_trace else None
+        error_code = _UNKNOWN
+        if message:
+            formatted = error_code.format_positional(message)
+        else:
+            message = self.DEFAULT_MESSAGE
+            formatted = self._DEFAULT_ERROR_MESSAGE
         super().__init__(
-            error_code=CommonErrorCodes.UNKNOWN_ERROR,
+            error_code=error_code,
             message_params={"message": message},
             data=data,
-            stack_trace=stack_trace
+            include_trace=include_trace,
+            message=formatted
         )
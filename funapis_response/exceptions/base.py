@@ -1,12 +1,25 @@
 """Base exception classes for funapis-response."""
 
-import traceback
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+import sys
+from typing import Any
 
 from funapis_response.core.payload import ResponsePayload
-from funapis_response.core.builder import ResponsePayloadBuilder
 from funapis_response.error_codes.base import ErrorCode
-from funapis_response.enums import UserLevel
+
+
+# 取得目前正在處理的例外；Python 3.11+ 的 sys.exception() 不需建立 exc_info tuple
+if sys.version_info >= (3, 11):
+    _handled_exception = sys.exception
+else:
+    def _handled_exception() -> BaseException | None:
+        return sys.exc_info()[1]
+
+
+def _rebuild_exception(cls: type, args: tuple) -> FunAPIException:
+    """依例外類別與 args 建立實例，欄位由 __reduce__ 提供的狀態還原"""
+    return cls.__new__(cls, *args)
 
 
 class FunAPIException(Exception):
@@ -15,18 +28,48 @@ class FunAPIException(Exception):
     def __init__(
         self,
         error_code: ErrorCode,
-        message_params: Optional[Dict[str, Any]] = None,
-        data: Optional[Any] = None,
-        stack_trace: Optional[str] = None
+        message_params: dict[str, Any] | None = None,
+        data: Any | None = None,
+        stack_trace: str | None = None,
+        message: str | None = None,
+        include_trace: bool = False
     ):
         self.error_code = error_code
         self.message_params = message_params or {}
         self.data = data
-        self.stack_trace = stack_trace
+        self._stack_trace = stack_trace
+        self._trace_snapshot = None
         
-        # 生成錯誤訊息
-        self.message = error_code.get_message(**self.message_params)
-        super().__init__(self.message)
+        # 僅擷取正在處理之例外的追蹤快照，於首次讀取 stack_trace 時才格式化
+        if stack_trace is None and include_trace:
+            handled = _handled_exception()
+            if handled is not None:
+                # 僅在實際需要時才載入 traceback 模組
+                import traceback
+                
+                # 快照包含 __cause__/__context__ 鏈，例外之後再次拋出也不影響輸出；
+                # 原始碼行於格式化時才讀取
+                self._trace_snapshot = traceback.TracebackException(
+                    type(handled), handled, handled.__traceback__, lookup_lines=False
+                )
+        
+        # 生成錯誤訊息；已提供預先格式化的訊息時略過格式化
+        if message is None:
+            message = error_code.get_message(**self.message_params)
+        self.message = message
+        super().__init__(message)
+    
+    def __reduce__(self):
+        """
+        支援 pickle 與 copy
+        
+        以 args 建立實例後還原 __dict__，不重新呼叫 __init__ 格式化訊息。
+        延遲的堆疊追蹤會先格式化，traceback 物件本身無法序列化。
+        """
+        state = dict(self.__dict__)
+        state["_stack_trace"] = self.stack_trace
+        state["_trace_snapshot"] = None
+        return _rebuild_exception, (self.__class__, self.args), state
     
     def to_response_payload(self) -> ResponsePayload:
         """
@@ -35,17 +78,31 @@ class FunAPIException(Exception):
         Returns:
             ResponsePayload 實例
         """
-        builder = ResponsePayloadBuilder()
-        builder.with_error_code(self.error_code.code)
-        builder.with_error_desc(self.message)
-        
-        if self.data:
-            builder.with_data(self.data)
-        
-        if self.stack_trace:
-            builder.with_stack_trace(self.stack_trace)
+        # 錯誤碼已於 ErrorCode 建立時驗證，直接建立載荷
+        return ResponsePayload._internal_create(
+            self.error_code.code,
+            self.message,
+            self.data,
+            self.stack_trace
+        )
+    
+    @property
+    def stack_trace(self) -> str | None:
+        """
+        堆疊追蹤字符串
         
-        return builder.build()
+        以 include_trace 建立時，於首次讀取時才格式化，並釋放保存的追蹤快照。
+        """
+        snapshot = self._trace_snapshot
+        if snapshot is not None:
+            self._stack_trace = "".join(snapshot.format())
+            self._trace_snapshot = None
+        return self._stack_trace
+    
+    @stack_trace.setter
+    def stack_trace(self, value: str | None) -> None:
+        self._stack_trace = value
+        self._trace_snapshot = None
     
     @staticmethod
     def get_current_stack_trace() -> str:
@@ -55,4 +112,6 @@ class FunAPIException(Exception):
         Returns:
             堆疊追蹤字符串
         """
+        import traceback
+        
         return traceback.format_exc()
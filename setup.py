@@ -1,5 +1,7 @@
 """Package installer for funapis-response."""
 
+import os
+
 from setuptools import setup, find_packages
 
 # Read the README.md for the long description
@@ -10,8 +12,6 @@ with open("README.md", "r", encoding="utf-8") as fh:
 install_requires = [
     # For datetime timezone handling
     "pytz>=2024.1",      
-    # For JSON serialization & type validation
-    "pydantic>=2.0.0",   
     # For better datetime handling
     "python-dateutil>=2.8.2",  
 ]
@@ -32,6 +32,23 @@ dev_requires = [
     "sphinx>=7.0.0",        
 ]
 
+# Optional Cython speedups for the response hot path
+# (enable with FUNAPIS_ENABLE_SPEEDUPS=true pip install --no-build-isolation .;
+# Cython must already be installed, an isolated build environment lacks it)
+ext_modules = []
+if os.environ.get("FUNAPIS_ENABLE_SPEEDUPS", "").lower() in ("1", "true", "yes"):
+    from Cython.Build import cythonize
+
+    # Modules are compiled in pure-python mode: the .py sources stay the
+    # reference implementation and remain importable when not compiled.
+    ext_modules = cythonize(
+        [
+            "funapis_response/core/builder.py",
+            "funapis_response/core/payload.py",
+        ],
+        compiler_directives={"language_level": "3"},
+    )
+
 setup(
     # Basic package information
     name="funapis-response",
@@ -59,6 +76,7 @@ setup(
     extras_require={
         "dev": dev_requires,
     },
+    ext_modules=ext_modules,
     
     # Package classifiers
     classifiers=[
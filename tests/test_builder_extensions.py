@@ -25,7 +25,10 @@ class TestBuilderExtensions(unittest.TestCase):
         """Test from_exception method."""
         reason = "必需參數缺失"
         data = {"field": "username"}
-        exception = ValidationError(reason=reason, data=data, include_trace=True)
+        try:
+            raise ValueError("username")
+        except ValueError:
+            exception = ValidationError(reason=reason, data=data, include_trace=True)
         
         response = ResponsePayloadBuilder.from_exception(exception).build()
         
@@ -51,6 +54,28 @@ class TestBuilderExtensions(unittest.TestCase):
         self.assertEqual(response.error_desc, "操作成功")
         self.assertIsNone(response.data)
 
+    
+    def test_empty_data_is_preserved(self):
+        """Test falsy data such as an empty list is kept in the response."""
+        response = ResponsePayloadBuilder.success([]).build()
+        self.assertEqual(response.to_dict()["data"], [])
+        
+        exception = ValidationError(reason="必需參數缺失", data=[])
+        self.assertEqual(ResponsePayloadBuilder.from_exception(exception).build().data, [])
+        self.assertEqual(exception.to_response_payload().to_dict()["data"], [])
+    
+    def test_success_dict(self):
+        """Test success_dict matches the builder's dictionary output."""
+        data = {"id": 1, "name": "Test"}
+        result = ResponsePayloadBuilder.success_dict(data)
+        expected = ResponsePayloadBuilder.success(data).build().to_dict()
+        
+        self.assertEqual(result.keys(), expected.keys())
+        self.assertEqual(result["errorCode"], CommonErrorCodes.SUCCESS.code)
+        self.assertEqual(result["errorDesc"], "操作成功")
+        self.assertEqual(result["data"], data)
+        self.assertNotIn("data", ResponsePayloadBuilder.success_dict())
+
 
 if __name__ == "__main__":
     unittest.main()
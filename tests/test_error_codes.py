@@ -1,6 +1,11 @@
 """Tests for the error codes implementation."""
 
+import os
+import pickle
+import subprocess
+import sys
 import unittest
+from dataclasses import FrozenInstanceError
 
 from funapis_response.error_codes import ErrorCode, CommonErrorCodes, ErrorCodeRegistry
 from funapis_response.enums import ErrorSeverity
@@ -16,10 +21,24 @@ class TestErrorCodes(unittest.TestCase):
         self.assertTrue(ErrorCode._validate_code_format(valid_code))
         
         # Invalid error codes
-        invalid_codes = ["FUN12345678", "ABC123456789", "FUN1234567890", "FUNabcdefghi"]
+        invalid_codes = [
+            "FUN12345678", "ABC123456789", "FUN1234567890", "FUNabcdefghi",
+            "FUN123456789\n", "FUN١٢٣٤٥٦٧٨٩", "fun123456789",
+        ]
         for code in invalid_codes:
             self.assertFalse(ErrorCode._validate_code_format(code), f"Should reject {code}")
     
+    def test_validate_many(self):
+        """Test batch validation matches per-code validation."""
+        codes = ["FUN123456789", "FUN12345678", "FUN1234567890", "ABC123456789",
+                 "FUN١٢٣٤٥٦٧٨٩", "FUNabcdefghi", "", "FUN123456789\x00", "FUN1234567\x00\x00"]
+        expected = [ErrorCode._validate_code_format(code) for code in codes]
+        
+        # Small batches and large (vectorized when NumPy is installed) batches
+        self.assertEqual(ErrorCode.validate_many(codes), expected)
+        self.assertEqual(ErrorCode.validate_many(codes * 50), expected * 50)
+        self.assertEqual(ErrorCode.validate_many(codes * 50 + [None]), expected * 50 + [False])
+    
     def test_error_code_registry(self):
         """Test error code registry."""
         # The registry should contain CommonErrorCodes
@@ -36,6 +55,16 @@ class TestErrorCodes(unittest.TestCase):
         self.assertIn(CommonErrorCodes.SUCCESS, all_codes)
         self.assertIn(CommonErrorCodes.VALIDATION_ERROR, all_codes)
     
+    def test_common_error_codes_registered(self):
+        """Test all common error codes are resolvable by code."""
+        codes = {error_code.code for error_code in ErrorCodeRegistry.get_all_codes()}
+        for code in ["FUN006600001", "FUN999999993", "FUN999999994",
+                     "FUN999999995", "FUN999900001", "FUN999999999"]:
+            self.assertIn(code, codes)
+            self.assertIsInstance(ErrorCode.get_by_code(code), ErrorCode)
+        
+        self.assertIsInstance(CommonErrorCodes.UNKNOWN_ERROR, ErrorCode)
+    
     def test_message_formatting(self):
         """Test message formatting with parameters."""
         validation_error = CommonErrorCodes.VALIDATION_ERROR
@@ -47,6 +76,45 @@ class TestErrorCodes(unittest.TestCase):
         message = validation_error.get_message()
         self.assertTrue("缺少格式化參數" in message)
     
+    def test_message_formatting_matches_str_format(self):
+        """Test pre-parsed templates format like str.format."""
+        templates = ["{a} 與 {{b}}: {c}", "{a!r}", "{a:>5}", "{a.real}", "無參數"]
+        for template in templates:
+            error_code = ErrorCode(
+                code="FUN123123123",
+                severity=ErrorSeverity.INFO,
+                message_template=template
+            )
+            self.assertEqual(error_code.get_message(a=1, c="x"), template.format(a=1, c="x"))
+    
+    def test_format_positional(self):
+        """Test positional formatting matches keyword formatting."""
+        reason = "字段不能為空"
+        validation_error = CommonErrorCodes.VALIDATION_ERROR
+        self.assertEqual(validation_error.format_positional(reason),
+                         validation_error.get_message(reason=reason))
+        self.assertTrue("缺少格式化參數" in validation_error.format_positional())
+        
+        # Repeated fields share a position; unparsed templates fall back to str.format
+        templates = ["{a} 與 {{b}}: {c} {a}", "{a!r} {c}", "{a:>5} {c}", "{a.real} {c}", "無參數"]
+        for template in templates:
+            error_code = ErrorCode(
+                code="FUN123123123",
+                severity=ErrorSeverity.INFO,
+                message_template=template
+            )
+            self.assertEqual(error_code.format_positional(1, "x"), template.format(a=1, c="x"))
+        
+        # Attribute and index fields are keyed by their argument name
+        for template, value in [("{a.real}", 5), ("{a[0]}", [7]), ("{a[0]} {a[1]} {c}", [1, 2])]:
+            error_code = ErrorCode(
+                code="FUN123123123",
+                severity=ErrorSeverity.INFO,
+                message_template=template
+            )
+            self.assertEqual(error_code.format_positional(value, "x"), error_code.get_message(a=value, c="x"))
+            self.assertNotIn("缺少格式化參數", error_code.format_positional(value, "x"))
+    
     def test_error_code_creation(self):
         """Test creating a new error code."""
         # Create a new error code
@@ -56,7 +124,11 @@ class TestErrorCodes(unittest.TestCase):
             message_template="Custom error: {detail}"
         )
         
-        # Verify it was registered
+        # Creating an error code does not register it
+        self.assertIsNone(ErrorCode.get_by_code("FUN987654321"))
+        
+        # Verify it can be retrieved once registered
+        self.assertIs(ErrorCodeRegistry.register(custom_code), custom_code)
         retrieved = ErrorCode.get_by_code("FUN987654321")
         self.assertEqual(retrieved, custom_code)
         
@@ -64,6 +136,55 @@ class TestErrorCodes(unittest.TestCase):
         message = custom_code.get_message(detail="Something went wrong")
         self.assertEqual(message, "Custom error: Something went wrong")
     
+    def test_error_code_is_slotted_and_immutable(self):
+        """Test error codes carry no instance dict and reject mutation."""
+        error_code = CommonErrorCodes.VALIDATION_ERROR
+        self.assertFalse(hasattr(error_code, "__dict__"))
+        
+        with self.assertRaises(FrozenInstanceError):
+            error_code.code = "FUN999999999"
+        with self.assertRaises(FrozenInstanceError):
+            del error_code.message_template
+        
+        # Copies round-trip through pickle and compare equal
+        copied = pickle.loads(pickle.dumps(error_code))
+        self.assertEqual(copied, error_code)
+        self.assertEqual(copied.get_message(reason="x"), error_code.get_message(reason="x"))
+    
+    def test_common_codes_do_not_override_registrations(self):
+        """Test materializing common codes keeps a user's registration of the same code."""
+        # Run in a fresh interpreter so the common codes are not yet materialized
+        code = (
+            "from funapis_response import ErrorCode, ErrorCodeRegistry, ErrorSeverity\n"
+            "from funapis_response import ResponsePayloadBuilder\n"
+            "custom = ErrorCode('FUN006600001', ErrorSeverity.INFO, '自訂成功')\n"
+            "ErrorCodeRegistry.register(custom)\n"
+            "ErrorCodeRegistry.get_all_codes()\n"
+            "ErrorCodeRegistry.get_registry()\n"
+            "ResponsePayloadBuilder.success()\n"
+            "from funapis_response import ValidationError\n"
+            "assert ErrorCodeRegistry.get_by_code('FUN006600001') is custom\n"
+            "assert ErrorCodeRegistry.get_registry()['FUN006600001'] is custom\n"
+        )
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=project_root)
+    
+    def test_registry_views(self):
+        """Test registry views are read-only and reflect new registrations."""
+        registry = ErrorCodeRegistry.get_registry()
+        with self.assertRaises(TypeError):
+            registry["FUN555555555"] = CommonErrorCodes.SUCCESS
+        
+        self.assertIs(ErrorCodeRegistry.get_all_codes(), ErrorCodeRegistry.get_all_codes())
+        
+        new_code = ErrorCodeRegistry.register(ErrorCode(
+            code="FUN555555555",
+            severity=ErrorSeverity.INFO,
+            message_template="Registered later"
+        ))
+        self.assertIn(new_code, ErrorCodeRegistry.get_all_codes())
+        self.assertIs(registry["FUN555555555"], new_code)
+    
     def test_invalid_error_code_creation(self):
         """Test creating an error code with invalid format."""
         with self.assertRaises(ValueError):
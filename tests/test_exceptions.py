@@ -1,5 +1,11 @@
 """Tests for the exceptions implementation."""
 
+import copy
+import os
+import pickle
+import subprocess
+import sys
+import traceback
 import unittest
 
 from funapis_response.exceptions import (
@@ -53,8 +59,19 @@ class TestExceptions(unittest.TestCase):
         self.assertEqual(exception.message, f"參數驗證失敗: {reason}")
         
         # Verify stack trace handling when include_trace=True
-        exception_with_trace = ValidationError(reason=reason, include_trace=True)
-        self.assertIsNotNone(exception_with_trace.stack_trace)
+        try:
+            raise KeyError("username")
+        except KeyError:
+            exception_with_trace = ValidationError(reason=reason, include_trace=True)
+            expected_trace = traceback.format_exc()
+        # The trace is formatted when first read, after the handler has exited
+        self.assertIn("KeyError", exception_with_trace.stack_trace)
+        self.assertEqual(exception_with_trace.stack_trace, expected_trace)
+        self.assertEqual(exception_with_trace.to_response_payload()._stack_trace, expected_trace)
+        
+        # No trace is captured outside of exception handling
+        exception_without_context = ValidationError(reason=reason, include_trace=True)
+        self.assertIsNone(exception_without_context.stack_trace)
     
     def test_api_error(self):
         """Test APIError exception."""
@@ -94,6 +111,79 @@ class TestExceptions(unittest.TestCase):
         exception = UnknownError(message=message)
         self.assertEqual(exception.message, f"未知錯誤: {message}")
 
+    def test_stack_trace_unaffected_by_later_reraise(self):
+        """Test the lazy trace matches format_exc() even if the exception is re-raised later."""
+        try:
+            raise KeyError("username")
+        except KeyError as error:
+            handled = error
+            exception = ValidationError(reason="bad", include_trace=True)
+            expected_trace = traceback.format_exc()
+        
+        # Re-raising inside another handler rewrites __context__ and extends __traceback__
+        try:
+            raise RuntimeError("unrelated")
+        except RuntimeError:
+            try:
+                raise handled
+            except KeyError:
+                pass
+        self.assertIsInstance(handled.__context__, RuntimeError)
+        
+        self.assertEqual(exception.stack_trace, expected_trace)
+        self.assertNotIn("RuntimeError", exception.stack_trace)
+    
+    def test_pickle_and_copy_round_trip(self):
+        """Test exceptions keep their fields through pickle and copy."""
+        exception = ValidationError(reason="bad", data={"x": 1})
+        try:
+            raise KeyError("username")
+        except KeyError:
+            traced = UnknownError()
+        
+        for original in (exception, traced):
+            for restored in (
+                pickle.loads(pickle.dumps(original)),
+                copy.copy(original),
+                copy.deepcopy(original)
+            ):
+                self.assertIs(type(restored), type(original))
+                self.assertEqual(restored.error_code, original.error_code)
+                self.assertEqual(restored.message_params, original.message_params)
+                self.assertEqual(restored.data, original.data)
+                self.assertEqual(restored.message, original.message)
+                self.assertEqual(restored.args, original.args)
+                self.assertEqual(restored.stack_trace, original.stack_trace)
+        
+        self.assertEqual(pickle.loads(pickle.dumps(exception)).message, "參數驗證失敗: bad")
+        self.assertIn("KeyError", pickle.loads(pickle.dumps(traced)).stack_trace)
+    
+    def test_builtin_exception_mixins(self):
+        """Test subclasses can mix in builtin exceptions with their own layout."""
+        for builtin in (TimeoutError, OSError, StopIteration):
+            mixed = type("Mixed" + builtin.__name__, (ValidationError, builtin), {})
+            exception = mixed(reason="逾時")
+            self.assertIsInstance(exception, builtin)
+            self.assertEqual(exception.message, "參數驗證失敗: 逾時")
+            self.assertEqual(copy.copy(exception).message, exception.message)
+    
+    def test_exception_classes_load_lazily(self):
+        """Test importing the package defers loading the concrete exceptions."""
+        code = (
+            "import sys, funapis_response\n"
+            "name = 'funapis_response.exceptions.api_exceptions'\n"
+            "assert name not in sys.modules\n"
+            "from funapis_response import ValidationError\n"
+            "assert name in sys.modules\n"
+            "assert ValidationError is sys.modules[name].ValidationError\n"
+        )
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        subprocess.run([sys.executable, "-c", code], check=True, cwd=project_root)
+        
+        import funapis_response.exceptions as exceptions
+        with self.assertRaises(AttributeError):
+            exceptions.EntityNotFoundError
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,14 +1,19 @@
 """Test cases for the response payload classes."""
 
+import json
 import unittest
-from datetime import datetime
+from datetime import datetime, tzinfo
 from zoneinfo import ZoneInfo
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from funapis_response import (
+    ResponsePayload,
+    PagingPayload,
+    OrderingPayload,
     ResponsePayloadBuilder,
     PagingPayloadBuilder,
     OrderingPayloadBuilder,
+    PayloadValidator,
 )
 from funapis_response.enums import SortDirection, UserLevel
 
@@ -37,6 +42,18 @@ class TestResponsePayload(unittest.TestCase):
         self.assertIsNone(response.data)
         self.assertIsNone(response.paging)
 
+    def test_default_message_fields(self):
+        """Test message id and datetime are generated at build time."""
+        builder = ResponsePayloadBuilder()\
+            .with_error_code("FUN006600001")\
+            .with_error_desc("Success")
+        response = builder.build()
+
+        self.assertIsInstance(response.message_id, UUID)
+        self.assertNotEqual(builder.build().message_id, response.message_id)
+        self.assertEqual(response.message_datetime.tzinfo, self.taipei_tz)
+        self.assertGreaterEqual(response.message_datetime, self.test_datetime)
+
     def test_response_with_data(self):
         """Test response with data payload."""
         test_data = {"key": "value"}
@@ -80,6 +97,79 @@ class TestResponsePayload(unittest.TestCase):
         self.assertEqual(response.paging.orders[0].property, "createTime")
         self.assertEqual(response.paging.orders[0].direction, SortDirection.DESC)
 
+    def test_to_dict(self):
+        """Test dictionary representation of the response."""
+        response = ResponsePayloadBuilder()\
+            .with_message_id(self.test_uuid)\
+            .with_message_datetime(self.test_datetime)\
+            .with_error_code("FUN006600001")\
+            .with_error_desc("Success")\
+            .build()
+
+        self.assertEqual(response.to_dict(), {
+            "messageId": str(self.test_uuid),
+            "messageDatetime": self.test_datetime.isoformat(),
+            "errorCode": "FUN006600001",
+            "errorDesc": "Success",
+        })
+
+    def test_to_json(self):
+        """Test JSON representation matches the dictionary representation."""
+        response = ResponsePayloadBuilder()\
+            .with_message_id(self.test_uuid)\
+            .with_message_datetime(self.test_datetime)\
+            .with_error_code("FUN006600001")\
+            .with_error_desc("成功")\
+            .with_data({"name": "測試", 1: [1, 2]})\
+            .build()
+
+        json_str = response.to_json()
+        self.assertIn("成功", json_str)
+        self.assertEqual(json.loads(json_str), {
+            **response.to_dict(),
+            "data": {"name": "測試", "1": [1, 2]},
+        })
+
+    def test_to_json_exact_output(self):
+        """Test to_json output format is pinned to the standard library encoder."""
+        response = ResponsePayloadBuilder()\
+            .with_message_id(UUID("12345678-1234-5678-1234-567812345678"))\
+            .with_message_datetime(datetime(2024, 1, 2, 3, 4, 5, tzinfo=self.taipei_tz))\
+            .with_error_code("FUN006600001")\
+            .with_error_desc("成功")\
+            .with_data({"big": 1e16, "nan": float("nan"), 1: [1, 2]})\
+            .build()
+
+        self.assertEqual(
+            response.to_json(),
+            '{"messageId": "12345678-1234-5678-1234-567812345678", '
+            '"messageDatetime": "2024-01-02T03:04:05+08:00", '
+            '"errorCode": "FUN006600001", "errorDesc": "成功", '
+            '"data": {"big": 1e+16, "nan": NaN, "1": [1, 2]}}'
+        )
+
+        # Values the standard library cannot encode raise regardless of environment
+        with self.assertRaises(TypeError):
+            ResponsePayload.from_error("FUN006600001", "成功", data={"at": datetime.now()}).to_json()
+
+    def test_response_is_immutable(self):
+        """Test response payloads are immutable value objects."""
+        def build():
+            return ResponsePayloadBuilder()\
+                .with_message_id(self.test_uuid)\
+                .with_message_datetime(self.test_datetime)\
+                .with_error_code("FUN006600001")\
+                .with_error_desc("Success")\
+                .build()
+
+        response = build()
+        with self.assertRaises(AttributeError):
+            response.error_code = "FUN009900001"
+        self.assertEqual(response, build())
+
+        # Slotted layout: no per-instance attribute dict
+        self.assertFalse(hasattr(response, "__dict__"))
+
     def test_stack_trace_visibility(self):
         """Test stack trace visibility for different user levels."""
         debug_info = "Debug stack trace"
@@ -100,6 +190,22 @@ class TestResponsePayload(unittest.TestCase):
         self.assertIn("stackTrace", dev_dict)
         self.assertEqual(dev_dict["stackTrace"], debug_info)
 
+    def test_from_error(self):
+        """Test creating an error response without a builder."""
+        response = ResponsePayload.from_error(
+            "FUN009900001", "System Error", stack_trace="trace"
+        )
+
+        self.assertIsInstance(response.message_id, UUID)
+        self.assertEqual(response.message_datetime.tzinfo, self.taipei_tz)
+        self.assertEqual(response.error_code, "FUN009900001")
+        self.assertEqual(response.error_desc, "System Error")
+        self.assertIsNone(response.data)
+        self.assertEqual(response._stack_trace, "trace")
+
+        with self.assertRaises(ValueError):
+            ResponsePayload.from_error("INVALID", "Test")
+
     def test_invalid_error_code(self):
         """Test validation of invalid error codes."""
         with self.assertRaises(ValueError):
@@ -121,6 +227,19 @@ class TestResponsePayload(unittest.TestCase):
                 .with_error_desc("Test")\
                 .build()
 
+        # A tzinfo without a UTC offset still makes the datetime naive
+        class NoOffset(tzinfo):
+            def utcoffset(self, dt):
+                return None
+
+        with self.assertRaises(ValueError):
+            ResponsePayloadBuilder()\
+                .with_message_id(self.test_uuid)\
+                .with_message_datetime(datetime.now(NoOffset()))\
+                .with_error_code("FUN006600001")\
+                .with_error_desc("Test")\
+                .build()
+
 
 class TestPagingPayload(unittest.TestCase):
     """Test cases for PagingPayload and its builder."""
@@ -145,6 +264,38 @@ class TestPagingPayload(unittest.TestCase):
                 .with_total_pages(10)\
                 .build()
 
+    def test_page_beyond_total_pages(self):
+        """Test validation of page number against total pages."""
+        with self.assertRaises(ValueError):
+            PagingPayloadBuilder()\
+                .with_page(10)\
+                .with_page_size(10)\
+                .with_total_elements(100)\
+                .with_total_pages(10)\
+                .build()
+
+    def test_validate_paging_params(self):
+        """Test paging parameter validation boundaries."""
+        def params(page=0, page_size=10, total_elements=100, total_pages=10):
+            return {
+                "page": page,
+                "pageSize": page_size,
+                "totalElements": total_elements,
+                "totalPages": total_pages,
+            }
+
+        self.assertTrue(PayloadValidator.validate_paging_params(params()))
+        self.assertTrue(PayloadValidator.validate_paging_params(params(page=9)))
+        self.assertTrue(PayloadValidator.validate_paging_params(params(page=3, total_elements=0, total_pages=0)))
+        self.assertFalse(PayloadValidator.validate_paging_params(params(page=-1)))
+        self.assertFalse(PayloadValidator.validate_paging_params(params(page_size=0)))
+        self.assertFalse(PayloadValidator.validate_paging_params(params(page_size=-5)))
+        self.assertFalse(PayloadValidator.validate_paging_params(params(total_elements=-1)))
+        self.assertFalse(PayloadValidator.validate_paging_params(params(total_pages=-1)))
+        self.assertFalse(PayloadValidator.validate_paging_params(params(page=10)))
+        self.assertFalse(PayloadValidator.validate_paging_params(params(page="1")))
+        self.assertFalse(PayloadValidator.validate_paging_params({"page": 0, "pageSize": 10}))
+
     def test_ordering(self):
         """Test ordering functionality."""
         order1 = OrderingPayloadBuilder()\
@@ -172,6 +323,42 @@ class TestPagingPayload(unittest.TestCase):
         self.assertEqual(paging_dict["orders"][1]["property"], "age")
         self.assertEqual(paging_dict["orders"][1]["direction"], "DESC")
 
+    def test_to_dict_returns_independent_copies(self):
+        """Test mutating a returned dict does not change later output."""
+        order = OrderingPayloadBuilder().with_property("name").build()
+        paging = PagingPayloadBuilder()\
+            .with_page(0)\
+            .with_page_size(10)\
+            .with_total_elements(100)\
+            .with_total_pages(10)\
+            .with_orders([order])\
+            .build()
+        response = ResponsePayloadBuilder.success().with_paging(paging).build()
+        expected = response.to_dict()
+
+        first = response.to_dict()
+        first["paging"]["page"] = 99
+        first["paging"]["orders"][0]["property"] = "changed"
+        first["paging"]["orders"].clear()
+        order_dict = order.to_dict()
+        order_dict["direction"] = "DESC"
+
+        self.assertEqual(response.to_dict(), expected)
+        self.assertEqual(paging.to_dict(), expected["paging"])
+        self.assertEqual(order.to_dict(), {"property": "name", "direction": "ASC"})
+
+    def test_to_dict_follows_orders_list(self):
+        """Test paging output matches its orders after the passed-in list changes."""
+        first = OrderingPayload("name")
+        second = OrderingPayload("age", SortDirection.DESC)
+        orders = [first]
+        paging = PagingPayload(0, 10, 1, 1, orders)
+        orders.append(second)
+
+        self.assertEqual(paging, PagingPayload(0, 10, 1, 1, [first, second]))
+        self.assertEqual(paging.to_dict(), PagingPayload(0, 10, 1, 1, [first, second]).to_dict())
+        self.assertEqual(len(paging.to_dict()["orders"]), 2)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file